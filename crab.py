@@ -6,14 +6,29 @@ Zero dependencies beyond Python 3.11+ stdlib.
 
 from __future__ import annotations
 
+import ctypes
 import curses
+import errno
 import math
+import mmap
 import os
 import random
 import re
+import struct
+import threading
 import time
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+except ImportError:  # zero-dependency install; per-crab fallback path is used
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # optional; CrabPool.step keeps the vectorized path
+    njit = None
+
 
 # ---------------------------------------------------------------------------
 # Constants & animation frames
@@ -24,46 +39,51 @@ HEADER_LINES = 3
 CPU_THRESHOLD = 5.0
 SCAN_INTERVAL = 3.0
 FRAME_INTERVAL = 0.1
+IDLE_FRAME_INTERVAL = 0.5  # frame time when no crab is walking
 
-WALK_FRAMES = [
-    [
+WALK_FRAMES = (
+    (
         " ▐▛███▜▌  ",
         "▝▜█████▛▘ ",
         "  ▘▘ ▝▝   ",
-    ],
-    [
+    ),
+    (
         " ▐▛███▜▌  ",
         "▝▜█████▛▘ ",
         " ▘▘   ▝▝  ",
-    ],
-    [
+    ),
+    (
         " ▐▛███▜▌  ",
         "▝▜█████▛▘ ",
         "  ▝▝ ▘▘   ",
-    ],
-    [
+    ),
+    (
         " ▐▛███▜▌  ",
         "▝▜█████▛▘ ",
         " ▘▘   ▝▝  ",
-    ],
-]
+    ),
+)
 
-SLEEP_FRAMES = [
-    [
+SLEEP_FRAMES = (
+    (
         "          ",
         "   z      ",
         " ▐█████▌  ",
         "▝▜█████▛▘ ",
         "  ▘▘ ▝▝   ",
-    ],
-    [
+    ),
+    (
         "      z   ",
         "     Z    ",
         " ▐█████▌  ",
         "▝▜█████▛▘ ",
         "  ▘▘ ▝▝   ",
-    ],
-]
+    ),
+)
+
+# Frame heights, hoisted so the hot paths don't re-measure the tables.
+_WALK_H = len(WALK_FRAMES[0])
+_SLEEP_H = len(SLEEP_FRAMES[0])
 
 WAITING_CRAB = [
     " ▐▛███▜▌  ",
@@ -73,6 +93,15 @@ WAITING_CRAB = [
 
 COLOR_NAMES = ["red", "green", "yellow", "blue", "magenta", "cyan", "white"]
 
+_HOME = os.path.expanduser("~")
+
+# 256 headings around the circle, cos/sin precomputed so steering never
+# calls libm: a bounce or jitter is just index arithmetic + two multiplies.
+_ANGLE_TAB = [
+    (math.cos(2 * math.pi * i / 256), math.sin(2 * math.pi * i / 256))
+    for i in range(256)
+]
+
 _COLOR_MAP = {
     "red": 1,
     "green": 2,
@@ -84,11 +113,196 @@ _COLOR_MAP = {
 }
 
 
+# Classification patterns, compiled once. The substring fast-reject in
+# _classify keeps the regex engine off the 99% of cmdlines with no "claude".
+_CLAUDE_RE = re.compile(rb"(^|/)claude(\s|$)")
+_SKIP_RE = re.compile(rb"pgrep|grep|crab[_-](?:tracker|canvas)|crab\.py")
+_VSCODE_EXT = b".vscode-server/extensions/anthropic.claude-code"
+
+
+# ---------------------------------------------------------------------------
+# Minimal io_uring wrapper — batches many small /proc reads per syscall
+# ---------------------------------------------------------------------------
+
+_NR_IO_URING_SETUP = 425
+_NR_IO_URING_ENTER = 426
+
+_IORING_OFF_SQ_RING = 0
+_IORING_OFF_CQ_RING = 0x8000000
+_IORING_OFF_SQES = 0x10000000
+
+_IORING_ENTER_GETEVENTS = 1
+_IORING_FEAT_SINGLE_MMAP = 1
+_IORING_OP_READ = 22
+
+
+class _SqringOffsets(ctypes.Structure):
+    _fields_ = [
+        ("head", ctypes.c_uint32),
+        ("tail", ctypes.c_uint32),
+        ("ring_mask", ctypes.c_uint32),
+        ("ring_entries", ctypes.c_uint32),
+        ("flags", ctypes.c_uint32),
+        ("dropped", ctypes.c_uint32),
+        ("array", ctypes.c_uint32),
+        ("resv1", ctypes.c_uint32),
+        ("user_addr", ctypes.c_uint64),
+    ]
+
+
+class _CqringOffsets(ctypes.Structure):
+    _fields_ = [
+        ("head", ctypes.c_uint32),
+        ("tail", ctypes.c_uint32),
+        ("ring_mask", ctypes.c_uint32),
+        ("ring_entries", ctypes.c_uint32),
+        ("overflow", ctypes.c_uint32),
+        ("cqes", ctypes.c_uint32),
+        ("flags", ctypes.c_uint32),
+        ("resv1", ctypes.c_uint32),
+        ("user_addr", ctypes.c_uint64),
+    ]
+
+
+class _IoUringParams(ctypes.Structure):
+    _fields_ = [
+        ("sq_entries", ctypes.c_uint32),
+        ("cq_entries", ctypes.c_uint32),
+        ("flags", ctypes.c_uint32),
+        ("sq_thread_cpu", ctypes.c_uint32),
+        ("sq_thread_idle", ctypes.c_uint32),
+        ("features", ctypes.c_uint32),
+        ("wq_fd", ctypes.c_uint32),
+        ("resv", ctypes.c_uint32 * 3),
+        ("sq_off", _SqringOffsets),
+        ("cq_off", _CqringOffsets),
+    ]
+
+
+class _IoUring:
+    """Pure-ctypes io_uring ring for batching reads of small /proc files.
+
+    One submit + one reap per batch replaces an open/read/close syscall
+    triple per file. Raises OSError from __init__ when the kernel (or a
+    seccomp filter) refuses the ring; callers fall back to sync reads.
+    """
+
+    _SQE_SIZE = 64
+    _CQE_SIZE = 16
+
+    def __init__(self, entries: int = 64) -> None:
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        params = _IoUringParams()
+        fd = self._libc.syscall(_NR_IO_URING_SETUP, entries, ctypes.byref(params))
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "io_uring_setup failed")
+        self._fd = fd
+        self.entries = params.sq_entries
+
+        sq_size = params.sq_off.array + params.sq_entries * 4
+        cq_size = params.cq_off.cqes + params.cq_entries * self._CQE_SIZE
+        if params.features & _IORING_FEAT_SINGLE_MMAP:
+            sq_size = cq_size = max(sq_size, cq_size)
+        try:
+            self._sq_mm = mmap.mmap(fd, sq_size, offset=_IORING_OFF_SQ_RING)
+            if params.features & _IORING_FEAT_SINGLE_MMAP:
+                self._cq_mm = self._sq_mm
+            else:
+                self._cq_mm = mmap.mmap(fd, cq_size, offset=_IORING_OFF_CQ_RING)
+            self._sqe_mm = mmap.mmap(
+                fd, params.sq_entries * self._SQE_SIZE, offset=_IORING_OFF_SQES,
+            )
+        except OSError:
+            os.close(fd)
+            raise
+
+        self._sq_head_off = params.sq_off.head
+        self._sq_tail_off = params.sq_off.tail
+        self._sq_array_off = params.sq_off.array
+        self._sq_mask = self._u32(self._sq_mm, params.sq_off.ring_mask)
+        self._cq_head_off = params.cq_off.head
+        self._cq_tail_off = params.cq_off.tail
+        self._cqes_off = params.cq_off.cqes
+        self._cq_mask = self._u32(self._cq_mm, params.cq_off.ring_mask)
+
+        self._bufsize = 4096
+        self._bufs = ctypes.create_string_buffer(self._bufsize * self.entries)
+        self._bufs_addr = ctypes.addressof(self._bufs)
+
+    @staticmethod
+    def _u32(mm: mmap.mmap, off: int) -> int:
+        return struct.unpack_from("<I", mm, off)[0]
+
+    @staticmethod
+    def _put_u32(mm: mmap.mmap, off: int, val: int) -> None:
+        struct.pack_into("<I", mm, off, val & 0xFFFFFFFF)
+
+    def read_batch(self, fds: list[int]) -> list[bytes | None]:
+        """Read offset 0 of every fd; one io_uring_enter per `entries` fds."""
+        results: list[bytes | None] = [None] * len(fds)
+        done = 0
+        n_einval = 0
+        while done < len(fds):
+            chunk = fds[done:done + self.entries]
+            tail = self._u32(self._sq_mm, self._sq_tail_off)
+            for slot, fd in enumerate(chunk):
+                idx = (tail + slot) & self._sq_mask
+                sqe_off = idx * self._SQE_SIZE
+                self._sqe_mm[sqe_off:sqe_off + self._SQE_SIZE] = bytes(self._SQE_SIZE)
+                struct.pack_into(
+                    "<BBHiQQIIQ", self._sqe_mm, sqe_off,
+                    _IORING_OP_READ, 0, 0, fd,
+                    0,  # file offset
+                    self._bufs_addr + slot * self._bufsize,
+                    self._bufsize,
+                    0,  # rw_flags
+                    slot,  # user_data
+                )
+                self._put_u32(self._sq_mm, self._sq_array_off + idx * 4, idx)
+            self._put_u32(self._sq_mm, self._sq_tail_off, tail + len(chunk))
+
+            ret = self._libc.syscall(
+                _NR_IO_URING_ENTER, self._fd,
+                len(chunk), len(chunk), _IORING_ENTER_GETEVENTS, None, 0,
+            )
+            if ret < 0:
+                raise OSError(ctypes.get_errno(), "io_uring_enter failed")
+
+            head = self._u32(self._cq_mm, self._cq_head_off)
+            cq_tail = self._u32(self._cq_mm, self._cq_tail_off)
+            while head != cq_tail:
+                cqe_off = self._cqes_off + (head & self._cq_mask) * self._CQE_SIZE
+                user_data, res = struct.unpack_from("<Qi", self._cq_mm, cqe_off)
+                if res > 0:
+                    results[done + user_data] = ctypes.string_at(
+                        self._bufs_addr + user_data * self._bufsize, res,
+                    )
+                elif res == -errno.EINVAL:
+                    n_einval += 1
+                head += 1
+            self._put_u32(self._cq_mm, self._cq_head_off, head)
+            done += len(chunk)
+        # Per-file errors (ESRCH, EACCES, ...) are normal and dropped, but
+        # every read failing with EINVAL means the kernel set the ring up
+        # and then rejected IORING_OP_READ itself — surface that so the
+        # caller switches to sync reads instead of seeing nothing forever.
+        if fds and n_einval == len(fds):
+            raise OSError(errno.EINVAL, "IORING_OP_READ unsupported")
+        return results
+
+    def close(self) -> None:
+        self._sqe_mm.close()
+        if self._cq_mm is not self._sq_mm:
+            self._cq_mm.close()
+        self._sq_mm.close()
+        os.close(self._fd)
+
+
 # ---------------------------------------------------------------------------
 # ProcessInfo + ProcessScanner — detect Claude instances via /proc
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ProcessInfo:
     pid: int
     type: str  # "cli", "vs", "runner"
@@ -104,26 +318,53 @@ class ProcessScanner:
         self.own_pid = os.getpid()
         self._prev_samples: dict[int, tuple[int, float]] = {}
         self._clk_tck = os.sysconf("SC_CLK_TCK")
+        self._inv_clk_tck_100 = 100.0 / self._clk_tck
+        self._stat_fds: dict[int, int] = {}
+        self._stat_cache: dict[int, tuple[int, int, int]] = {}
+        # Scratch buffer for the small /proc reads on the sync paths; every
+        # caller copies or parses out what it needs before the next read.
+        self._rbuf = bytearray(8192)
+        self._gitroot_cache: dict[str, str | None] = {}
+        self._branch_cache: dict[str, tuple[float, str]] = {}
+        # Latest snapshot published by the background scan thread. A plain
+        # reference swap is atomic in CPython, so readers need no lock;
+        # generation tells consumers when a new snapshot landed.
+        self.latest: list[ProcessInfo] = []
+        self.generation = 0
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        try:
+            self._ring: _IoUring | None = _IoUring()
+        except OSError:
+            self._ring = None
 
     def scan(self) -> list[ProcessInfo]:
         results: list[ProcessInfo] = []
         seen_pids: set[int] = set()
+        seen_cwds: set[str] = set()
+        self._stat_cache.clear()
 
+        pids: list[int] = []
         try:
-            entries = os.listdir("/proc")
+            with os.scandir("/proc") as it:
+                for entry in it:
+                    name = entry.name
+                    # One comparison rejects the non-PID entries (they all
+                    # start with a letter); isdigit only runs on the rest.
+                    if name[0] < "0" or name[0] > "9" or not name.isdigit():
+                        continue
+                    pids.append(int(name))
         except OSError:
             return results
 
-        for entry in entries:
-            if not entry.isdigit():
-                continue
-            pid = int(entry)
+        cmdlines = self._read_cmdlines(pids)
+
+        for pid in pids:
             if pid == self.own_pid:
                 continue
 
-            try:
-                cmdline = self._read_cmdline(pid)
-            except (FileNotFoundError, PermissionError, ProcessLookupError, OSError):
+            cmdline = cmdlines.get(pid)
+            if cmdline is None:
                 continue
 
             proc_type = self._classify(cmdline, pid)
@@ -137,42 +378,152 @@ class ProcessScanner:
                 pid=pid, type=proc_type, cpu_pct=cpu_pct, cwd=cwd, branch=branch,
             ))
             seen_pids.add(pid)
+            seen_cwds.add(cwd)
 
-        # Purge stale samples
+        # Purge stale samples and cached fds
         for pid in list(self._prev_samples):
             if pid not in seen_pids:
                 del self._prev_samples[pid]
+        for pid in list(self._stat_fds):
+            if pid not in seen_pids:
+                os.close(self._stat_fds.pop(pid))
+        # ...and git caches for cwds no live pid references anymore
+        for cwd in list(self._gitroot_cache):
+            if cwd not in seen_cwds:
+                del self._gitroot_cache[cwd]
+        live_heads = {
+            os.path.join(root, ".git", "HEAD")
+            for root in self._gitroot_cache.values()
+            if root is not None
+        }
+        for head in list(self._branch_cache):
+            if head not in live_heads:
+                del self._branch_cache[head]
 
         return results
 
-    def _read_cmdline(self, pid: int) -> str:
-        with open(f"/proc/{pid}/cmdline", "rb") as f:
-            raw = f.read()
-        return raw.replace(b"\x00", b" ").decode("utf-8", errors="replace").strip()
+    def start(self, interval: float = SCAN_INTERVAL) -> None:
+        """Run scan() on a daemon thread so the render loop never stalls."""
+        self._thread = threading.Thread(
+            target=self._scan_loop, args=(interval,), daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+    def _scan_loop(self, interval: float) -> None:
+        while not self._stop_event.is_set():
+            results = self.scan()
+            self.latest = results
+            self.generation += 1
+            self._stop_event.wait(interval)
+
+    def _cached_fd(self, cache: dict[int, int], pid: int, name: str) -> int:
+        """Open /proc/<pid>/<name> once and keep the fd for later scans."""
+        fd = cache.get(pid)
+        if fd is None:
+            fd = os.open(f"/proc/{pid}/{name}", os.O_RDONLY)
+            cache[pid] = fd
+        return fd
+
+    def _drop_fd(self, cache: dict[int, int], pid: int) -> None:
+        fd = cache.pop(pid, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _read_cmdlines(self, pids: list[int]) -> dict[int, bytes]:
+        """Read every pid's cmdline, batched through io_uring when available."""
+        out: dict[int, bytes] = {}
+        if self._ring is not None:
+            # Open/read/close one ring's worth of fds at a time so the peak
+            # open-fd count is bounded by the ring size, not the process
+            # count — hundreds of pids must not run into RLIMIT_NOFILE.
+            step = self._ring.entries
+            for i in range(0, len(pids), step):
+                fds: list[int] = []
+                fd_pids: list[int] = []
+                for pid in pids[i:i + step]:
+                    try:
+                        fds.append(os.open(f"/proc/{pid}/cmdline", os.O_RDONLY))
+                    except OSError:
+                        continue
+                    fd_pids.append(pid)
+                try:
+                    raws = self._ring.read_batch(fds)
+                except OSError:
+                    # Ring died mid-flight (e.g. seccomp kill of enter, or
+                    # an unsupported read op); drop it for good and start
+                    # over on the sync path below.
+                    self._ring = None
+                    out.clear()
+                    break
+                finally:
+                    for fd in fds:
+                        os.close(fd)
+                for pid, raw in zip(fd_pids, raws):
+                    if raw:
+                        out[pid] = raw.replace(b"\x00", b" ").strip()
+            else:
+                return out
 
-    def _classify(self, cmdline: str, pid: int = 0) -> str | None:
-        if not cmdline:
+        for pid in pids:
+            try:
+                out[pid] = self._read_cmdline(pid)
+            except (FileNotFoundError, PermissionError, ProcessLookupError, OSError):
+                continue
+        return out
+
+    def _read_cmdline(self, pid: int) -> bytes:
+        fd = os.open(f"/proc/{pid}/cmdline", os.O_RDONLY)
+        try:
+            n = os.readv(fd, [self._rbuf])
+        finally:
+            os.close(fd)
+        return bytes(self._rbuf[:n].replace(b"\x00", b" ").strip())
+
+    def _classify(self, cmdline: bytes, pid: int = 0) -> str | None:
+        if not cmdline or b"claude" not in cmdline:
             return None
-        if ".vscode-server/extensions/anthropic.claude-code" in cmdline:
+        if _VSCODE_EXT in cmdline:
             return "vs"
-        if re.search(r"(^|/)claude(\s|$)", cmdline):
-            if any(skip in cmdline for skip in ("pgrep", "grep", "crab_tracker", "crab-tracker", "crab_canvas", "crab.py")):
+        if _CLAUDE_RE.search(cmdline):
+            if _SKIP_RE.search(cmdline):
                 return None
             if pid and self._is_runner_parent(pid):
                 return "runner"
             return "cli"
         return None
 
-    def _read_ppid(self, pid: int) -> int:
+    def _read_stat(self, pid: int) -> tuple[int, int, int] | None:
+        """Parse (ppid, utime, stime) from /proc/<pid>/stat, cached per scan."""
+        parsed = self._stat_cache.get(pid)
+        if parsed is not None:
+            return parsed
         try:
-            with open(f"/proc/{pid}/status") as f:
-                for line in f:
-                    if line.startswith("PPid:"):
-                        return int(line.split()[1])
+            fd = self._cached_fd(self._stat_fds, pid, "stat")
+            n = os.preadv(fd, [self._rbuf], 0)
+            close_paren = self._rbuf.rfind(b")", 0, n)
+            # Bounded split: we only need post-comm fields [1]=ppid,
+            # [11]=utime, [12]=stime (stat(5) fields 4/14/15), so stop
+            # tokenizing instead of materializing all ~50 fields.
+            remainder = self._rbuf[close_paren + 2:n].split(None, 13)
+            parsed = (int(remainder[1]), int(remainder[11]), int(remainder[12]))
         except (FileNotFoundError, PermissionError, ProcessLookupError,
                 IndexError, ValueError, OSError):
-            pass
-        return 0
+            self._drop_fd(self._stat_fds, pid)
+            return None
+        self._stat_cache[pid] = parsed
+        return parsed
+
+    def _read_ppid(self, pid: int) -> int:
+        stat = self._read_stat(pid)
+        return stat[0] if stat is not None else 0
 
     def _is_runner_parent(self, pid: int) -> bool:
         current = pid
@@ -182,9 +533,9 @@ class ProcessScanner:
                 break
             try:
                 parent_cmd = self._read_cmdline(ppid)
-                if "runner" in parent_cmd and "work" in parent_cmd:
+                if b"runner" in parent_cmd and b"work" in parent_cmd:
                     return True
-                if "tmux" in parent_cmd:
+                if b"tmux" in parent_cmd:
                     return True
             except (FileNotFoundError, PermissionError, ProcessLookupError, OSError):
                 break
@@ -206,35 +557,57 @@ class ProcessScanner:
     def _read_branch(self, cwd: str) -> str:
         if cwd == "?":
             return ""
+        try:
+            root = self._gitroot_cache[cwd]
+        except KeyError:
+            root = self._find_git_root(cwd)
+            self._gitroot_cache[cwd] = root
+        if root is None:
+            return ""
+
+        head = os.path.join(root, ".git", "HEAD")
+        try:
+            mtime = os.stat(head).st_mtime
+        except OSError:
+            # Repo vanished or became unreadable; rediscover next scan.
+            del self._gitroot_cache[cwd]
+            self._branch_cache.pop(head, None)
+            return ""
+
+        cached = self._branch_cache.get(head)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        branch = self._parse_head(head)
+        self._branch_cache[head] = (mtime, branch)
+        return branch
+
+    def _find_git_root(self, cwd: str) -> str | None:
         path = cwd
         for _ in range(20):
-            head = os.path.join(path, ".git", "HEAD")
-            try:
-                with open(head) as f:
-                    content = f.read().strip()
-                if content.startswith("ref: refs/heads/"):
-                    return content[16:]
-                return content[:12]
-            except (FileNotFoundError, PermissionError, OSError):
-                parent = os.path.dirname(path)
-                if parent == path:
-                    break
-                path = parent
-        return ""
+            if os.path.isfile(os.path.join(path, ".git", "HEAD")):
+                return path
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+        return None
 
-    def _measure_cpu(self, pid: int) -> float:
+    def _parse_head(self, head: str) -> str:
         try:
-            with open(f"/proc/{pid}/stat") as f:
-                stat_raw = f.read()
-            close_paren = stat_raw.rfind(")")
-            remainder = stat_raw[close_paren + 2:].split()
-            utime = int(remainder[11])
-            stime = int(remainder[12])
-        except (FileNotFoundError, PermissionError, ProcessLookupError,
-                IndexError, ValueError, OSError):
+            with open(head) as f:
+                content = f.read().strip()
+        except (FileNotFoundError, PermissionError, OSError):
+            return ""
+        if content.startswith("ref: refs/heads/"):
+            return content[16:]
+        return content[:12]
+
+    def _measure_cpu(self, pid: int) -> float:
+        stat = self._read_stat(pid)
+        if stat is None:
             return 0.0
 
-        total_ticks = utime + stime
+        total_ticks = stat[1] + stat[2]
         now = time.monotonic()
         prev = self._prev_samples.get(pid)
         self._prev_samples[pid] = (total_ticks, now)
@@ -247,14 +620,14 @@ class ProcessScanner:
         if dt <= 0:
             return 0.0
 
-        return (total_ticks - prev_ticks) / self._clk_tck / dt * 100.0
+        return (total_ticks - prev_ticks) * self._inv_clk_tck_100 / dt
 
 
 # ---------------------------------------------------------------------------
 # CrabEntity — one animated crab per Claude instance
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class CrabEntity:
     pid: int
     proc_type: str
@@ -273,18 +646,41 @@ class CrabEntity:
     y: float = 0.0
     dx: float = 0.0
     dy: float = 0.0
+    speed: float = 0.0
+    _angle_idx: int = 0
     scr_w: int = 80
     scr_h: int = 24
 
+    # Cached label strings; rebuilt only when the underlying value changes
+    # instead of per frame per crab.
+    _label_cache: str = ""
+    _label_cpu: float = -1.0
+    _dir_label_cache: str = "?"
+
+    # Last-drawn state for dirty-rect rendering: what was drawn and the
+    # rectangle it covered, so unchanged crabs are skipped and moved ones
+    # blank only their old cells.
+    _last_sig: tuple | None = None
+    _last_rect: tuple[int, int, int, int] | None = None
+
+    def mark_dirty(self) -> None:
+        """Force a redraw on the next frame (e.g. after a full erase)."""
+        self._last_sig = None
+        self._last_rect = None
+
     def __post_init__(self) -> None:
         play_w = max(1, self.scr_w - CRAB_WIDTH)
         play_h = max(1, self.scr_h - HEADER_LINES - 8)
         self.x = random.uniform(1, play_w)
         self.y = random.uniform(HEADER_LINES + 1, HEADER_LINES + 1 + play_h)
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(0.3, 0.7)
-        self.dx = math.cos(angle) * speed
-        self.dy = math.sin(angle) * speed
+        self._set_heading(random.randrange(256), random.uniform(0.3, 0.7))
+
+    def _set_heading(self, angle_idx: int, speed: float) -> None:
+        self._angle_idx = angle_idx & 255
+        self.speed = speed
+        c, s = _ANGLE_TAB[self._angle_idx]
+        self.dx = c * speed
+        self.dy = s * speed
 
     def set_active(
         self,
@@ -296,52 +692,49 @@ class CrabEntity:
         was = self.active
         self.active = active
         self.cpu_pct = cpu_pct
-        if cwd is not None:
+        if cwd is not None and cwd != self.cwd:
             self.cwd = cwd
+            if cwd.startswith(_HOME):
+                cwd = "~" + cwd[len(_HOME):]
+            self._dir_label_cache = cwd
         if branch is not None:
             self.branch = branch
         if active and not was:
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(0.3, 0.7)
-            self.dx = math.cos(angle) * speed
-            self.dy = math.sin(angle) * speed
+            self._set_heading(random.randrange(256), random.uniform(0.3, 0.7))
             self.just_slept = False
         if not active and was:
             self.just_slept = True
         elif not (not active and was):
             self.just_slept = False
 
-    def update(self) -> None:
+    def update(self, move: bool = True) -> None:
         self.tick += 1
         if self.active:
-            self._walk()
+            if self.tick % 3 == 0:
+                self.walk_frame = (self.walk_frame + 1) % len(WALK_FRAMES)
+            if move:
+                self._walk()
         else:
             self._sleep()
 
     def _walk(self) -> None:
-        if self.tick % 3 == 0:
-            self.walk_frame = (self.walk_frame + 1) % len(WALK_FRAMES)
         self.x += self.dx
         self.y += self.dy
-        crab_h = len(WALK_FRAMES[0]) + 2
+        crab_h = _WALK_H + 2
         min_y = HEADER_LINES
         max_y = self.scr_h - crab_h - 1
         max_x = self.scr_w - CRAB_WIDTH
-        if self.x < 0:
-            self.x = 0
-            self.dx = abs(self.dx)
-            self._jitter()
-        elif self.x > max_x:
-            self.x = max_x
-            self.dx = -abs(self.dx)
-            self._jitter()
-        if self.y < min_y:
-            self.y = min_y
-            self.dy = abs(self.dy)
+        # One branch per axis: clamp, then mirror the heading only when it
+        # points away from the playfield midpoint.
+        if self.x < 0 or self.x > max_x:
+            self.x = min(max(self.x, 0.0), float(max_x))
+            if (self.x * 2 < max_x) != (self.dx > 0):
+                self._angle_idx = (128 - self._angle_idx) & 255
             self._jitter()
-        elif self.y > max_y:
-            self.y = float(max(min_y, max_y))
-            self.dy = -abs(self.dy)
+        if self.y < min_y or self.y > max_y:
+            self.y = min(max(self.y, float(min_y)), float(max(min_y, max_y)))
+            if (self.y * 2 < min_y + max_y) != (self.dy > 0):
+                self._angle_idx = -self._angle_idx & 255
             self._jitter()
         if random.random() < 0.02:
             self._jitter()
@@ -351,34 +744,187 @@ class CrabEntity:
             self.sleep_frame = (self.sleep_frame + 1) % len(SLEEP_FRAMES)
 
     def _jitter(self) -> None:
-        speed = max(0.3, min(0.7, math.hypot(self.dx, self.dy)))
-        angle = math.atan2(self.dy, self.dx) + random.uniform(-0.4, 0.4)
-        self.dx = math.cos(angle) * speed
-        self.dy = math.sin(angle) * speed
+        # ±16 table steps ≈ the old ±0.4 rad perturbation.
+        self._set_heading(self._angle_idx + random.randint(-16, 16), self.speed)
 
     def update_bounds(self, scr_w: int, scr_h: int) -> None:
         self.scr_w = scr_w
         self.scr_h = scr_h
         max_x = scr_w - CRAB_WIDTH
-        max_y = scr_h - len(SLEEP_FRAMES[1]) - 2
+        max_y = scr_h - _SLEEP_H - 2
         self.x = max(0, min(self.x, max_x))
         self.y = max(HEADER_LINES, min(self.y, max_y))
 
-    def get_lines(self) -> list[str]:
+    def get_lines(self) -> tuple[str, ...]:
         if self.active:
             return WALK_FRAMES[self.walk_frame]
         return SLEEP_FRAMES[self.sleep_frame]
 
     def label(self) -> str:
-        tag = self.proc_type.upper()
-        return f"[{tag}:{self.pid}] {self.cpu_pct:4.1f}%"
+        if not self._label_cache or self._label_cpu != self.cpu_pct:
+            tag = self.proc_type.upper()
+            self._label_cache = f"[{tag}:{self.pid}] {self.cpu_pct:4.1f}%"
+            self._label_cpu = self.cpu_pct
+        return self._label_cache
 
     def dir_label(self) -> str:
-        home = os.path.expanduser("~")
-        cwd = self.cwd
-        if cwd.startswith(home):
-            cwd = "~" + cwd[len(home):]
-        return cwd
+        return self._dir_label_cache
+
+
+# ---------------------------------------------------------------------------
+# CrabPool — SoA physics state, advanced with vectorized NumPy ops
+# ---------------------------------------------------------------------------
+
+def _step_all(x, y, dx, dy, active, alive, max_x, min_y, max_y, rnd, ang):
+    """Advance every active crab one frame; numba-jitted when available.
+
+    rnd/ang are per-crab random draws precomputed with numpy so the
+    kernel never touches the Python RNG.
+    """
+    for i in range(x.shape[0]):
+        if not (alive[i] and active[i]):
+            continue
+        xi = x[i] + dx[i]
+        yi = y[i] + dy[i]
+        bounced = False
+        if xi < 0.0:
+            xi = 0.0
+            dx[i] = abs(dx[i])
+            bounced = True
+        elif xi > max_x:
+            xi = max_x
+            dx[i] = -abs(dx[i])
+            bounced = True
+        if yi < min_y:
+            yi = min_y
+            dy[i] = abs(dy[i])
+            bounced = True
+        elif yi > max_y:
+            yi = max_y
+            dy[i] = -abs(dy[i])
+            bounced = True
+        x[i] = xi
+        y[i] = yi
+        if bounced or rnd[i] < 0.02:
+            speed = math.hypot(dx[i], dy[i])
+            speed = 0.3 if speed < 0.3 else (0.7 if speed > 0.7 else speed)
+            a = math.atan2(dy[i], dx[i]) + ang[i]
+            dx[i] = math.cos(a) * speed
+            dy[i] = math.sin(a) * speed
+
+
+if njit is not None:
+    _step_all = njit(cache=True, fastmath=True)(_step_all)
+
+
+class CrabPool:
+    """Structure-of-arrays storage for the per-frame physics fields.
+
+    Position and velocity live in parallel float32 arrays so one step()
+    call advances, bounces and jitters every active crab at once instead
+    of pointer-chasing through N dataclass instances. Cosmetic state
+    (color, branch, frames) stays on CrabEntity; positions are written
+    back into the entities just before drawing. Requires numpy — _main
+    keeps the per-crab update path when it is unavailable.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self.capacity = capacity
+        self.x = np.zeros(capacity, np.float32)
+        self.y = np.zeros(capacity, np.float32)
+        self.dx = np.zeros(capacity, np.float32)
+        self.dy = np.zeros(capacity, np.float32)
+        self.active = np.zeros(capacity, np.bool_)
+        self.alive = np.zeros(capacity, np.bool_)
+        self.pid_to_idx: dict[int, int] = {}
+
+    def _grow(self) -> None:
+        new_cap = self.capacity * 2
+        for name in ("x", "y", "dx", "dy", "active", "alive"):
+            old = getattr(self, name)
+            grown = np.zeros(new_cap, old.dtype)
+            grown[:self.capacity] = old
+            setattr(self, name, grown)
+        self.capacity = new_cap
+
+    def add(self, crab: CrabEntity) -> None:
+        free = np.flatnonzero(~self.alive)
+        if len(free) == 0:
+            self._grow()
+            free = np.flatnonzero(~self.alive)
+        idx = int(free[0])
+        self.pid_to_idx[crab.pid] = idx
+        self.x[idx] = crab.x
+        self.y[idx] = crab.y
+        self.alive[idx] = True
+        self.sync(crab)
+
+    def remove(self, pid: int) -> None:
+        idx = self.pid_to_idx.pop(pid, None)
+        if idx is not None:
+            self.alive[idx] = False
+            self.active[idx] = False
+
+    def sync(self, crab: CrabEntity) -> None:
+        """Pull velocity/active changes made by CrabEntity.set_active."""
+        idx = self.pid_to_idx.get(crab.pid)
+        if idx is None:
+            return
+        self.dx[idx] = crab.dx
+        self.dy[idx] = crab.dy
+        self.active[idx] = crab.active
+
+    def step(self, scr_w: int, scr_h: int) -> None:
+        moving = self.alive & self.active
+        if not moving.any():
+            return
+
+        max_x = max(0, scr_w - CRAB_WIDTH)
+        min_y = HEADER_LINES
+        max_y = max(min_y, scr_h - (_WALK_H + 2) - 1)
+
+        if njit is not None:
+            _step_all(
+                self.x, self.y, self.dx, self.dy, self.active, self.alive,
+                np.float32(max_x), np.float32(min_y), np.float32(max_y),
+                np.random.random(self.capacity).astype(np.float32),
+                np.random.uniform(-0.4, 0.4, self.capacity).astype(np.float32),
+            )
+            return
+
+        self.x[moving] += self.dx[moving]
+        self.y[moving] += self.dy[moving]
+
+        hit_lo_x = moving & (self.x < 0)
+        hit_hi_x = moving & (self.x > max_x)
+        hit_lo_y = moving & (self.y < min_y)
+        hit_hi_y = moving & (self.y > max_y)
+        self.dx = np.where(hit_lo_x, np.abs(self.dx), self.dx)
+        self.dx = np.where(hit_hi_x, -np.abs(self.dx), self.dx)
+        self.dy = np.where(hit_lo_y, np.abs(self.dy), self.dy)
+        self.dy = np.where(hit_hi_y, -np.abs(self.dy), self.dy)
+        np.clip(self.x, 0, max_x, out=self.x)
+        np.clip(self.y, min_y, max_y, out=self.y)
+
+        bounced = hit_lo_x | hit_hi_x | hit_lo_y | hit_hi_y
+        jitter = bounced | (moving & (np.random.random(self.capacity) < 0.02))
+        if jitter.any():
+            speed = np.clip(np.hypot(self.dx, self.dy), 0.3, 0.7)
+            angle = np.arctan2(self.dy, self.dx) + np.random.uniform(
+                -0.4, 0.4, self.capacity,
+            ).astype(np.float32)
+            self.dx = np.where(jitter, np.cos(angle) * speed, self.dx)
+            self.dy = np.where(jitter, np.sin(angle) * speed, self.dy)
+
+    def writeback(self, crabs: dict[int, CrabEntity]) -> None:
+        """Materialize pool positions into the entities for the draw pass."""
+        for pid, idx in self.pid_to_idx.items():
+            crab = crabs.get(pid)
+            if crab is not None:
+                crab.x = float(self.x[idx])
+                crab.y = float(self.y[idx])
+                crab.dx = float(self.dx[idx])
+                crab.dy = float(self.dy[idx])
 
 
 # ---------------------------------------------------------------------------
@@ -420,20 +966,48 @@ def _draw_header(stdscr, total: int, active: int, idle: int) -> None:
     _safe_addstr(stdscr, 1, 0, stats.ljust(w), curses.color_pair(4))
 
 
-def _draw_waiting(stdscr) -> None:
-    h, w = stdscr.getmaxyx()
-    cy = max(3, h // 2 - 3)
-    cx = max(0, (w - CRAB_WIDTH) // 2)
+class _WaitingScreen:
+    """Draws the static no-instances screen, at most once per wipe/resize.
+
+    The cells stay on screen between frames now that the main loop no
+    longer erases every frame, so steady-state waiting frames are free.
+    """
+
+    def __init__(self) -> None:
+        self._drawn_hw: tuple[int, int] | None = None
+
+    def invalidate(self) -> None:
+        self._drawn_hw = None
+
+    def draw(self, stdscr, h: int, w: int) -> None:
+        if self._drawn_hw == (h, w):
+            return
+        cy = max(3, h // 2 - 3)
+        cx = max(0, (w - CRAB_WIDTH) // 2)
+
+        for i, line in enumerate(WAITING_CRAB):
+            _put(stdscr, cy + i, cx, line, 0, h, w)
 
-    for i, line in enumerate(WAITING_CRAB):
-        _safe_addstr(stdscr, cy + i, cx, line)
+        msg = "No Claude instances detected... waiting"
+        msg_x = max(0, (w - len(msg)) // 2)
+        _put(stdscr, cy + len(WAITING_CRAB) + 1, msg_x, msg, curses.A_DIM, h, w)
+        self._drawn_hw = (h, w)
 
-    msg = "No Claude instances detected... waiting"
-    msg_x = max(0, (w - len(msg)) // 2)
-    _safe_addstr(stdscr, cy + len(WAITING_CRAB) + 1, msg_x, msg, curses.A_DIM)
 
+def _put(stdscr, y: int, x: int, text: str, attr: int, h: int, w: int) -> None:
+    """_safe_addstr with the screen size supplied by the caller."""
+    if y < 0 or y >= h or x >= w:
+        return
+    max_len = w - x
+    if max_len <= 0:
+        return
+    try:
+        stdscr.addstr(y, x, text[:max_len], attr)
+    except curses.error:
+        pass
 
-def _draw_crab(stdscr, crab: CrabEntity) -> None:
+
+def _draw_crab(stdscr, crab: CrabEntity, h: int, w: int) -> None:
     pair = _COLOR_MAP.get(crab.color, 7)
     attr = curses.color_pair(pair)
 
@@ -441,21 +1015,51 @@ def _draw_crab(stdscr, crab: CrabEntity) -> None:
     iy = int(round(crab.y))
 
     lines = crab.get_lines()
+    lbl = crab.label()
+    dir_lbl = crab.dir_label()
+    ball = f"( {crab.branch} )" if crab.branch else ""
 
-    if crab.branch:
-        ball = f"( {crab.branch} )"
-        bx = ix + CRAB_WIDTH
-        _safe_addstr(stdscr, iy, bx, ball, curses.A_DIM)
-
-    for offset, line in enumerate(lines):
-        _safe_addstr(stdscr, iy + offset, ix, line, attr | curses.A_BOLD)
+    frame = crab.walk_frame if crab.active else crab.sleep_frame
+    sig = (ix, iy, crab.active, frame, ball, lbl, dir_lbl)
+    if sig == crab._last_sig:
+        return
 
-    lbl = crab.label()
-    lbl_y = iy + len(lines)
-    _safe_addstr(stdscr, lbl_y, ix, lbl, attr)
+    # Blank the previously covered rectangle before drawing the new one.
+    if crab._last_rect is not None:
+        old_ix, old_iy, old_w, old_h = crab._last_rect
+        blank = " " * old_w
+        for offset in range(old_h):
+            _put(stdscr, old_iy + offset, old_ix, blank, 0, h, w)
+
+    if ball:
+        _put(stdscr, iy, ix + CRAB_WIDTH, ball, curses.A_DIM, h, w)
+
+    # All body/label rows share x, so compute the clip width once.
+    max_len = w - ix
+    if max_len > 0 and ix < w:
+        bold = attr | curses.A_BOLD
+        for offset, line in enumerate(lines):
+            y = iy + offset
+            if 0 <= y < h:
+                try:
+                    stdscr.addstr(y, ix, line[:max_len], bold)
+                except curses.error:
+                    pass
+        lbl_y = iy + len(lines)
+        if 0 <= lbl_y < h:
+            try:
+                stdscr.addstr(lbl_y, ix, lbl[:max_len], attr)
+            except curses.error:
+                pass
+        if 0 <= lbl_y + 1 < h:
+            try:
+                stdscr.addstr(lbl_y + 1, ix, dir_lbl[:max_len], curses.A_DIM)
+            except curses.error:
+                pass
 
-    dir_lbl = crab.dir_label()
-    _safe_addstr(stdscr, lbl_y + 1, ix, dir_lbl, curses.A_DIM)
+    rect_w = max(CRAB_WIDTH + len(ball), len(lbl), len(dir_lbl))
+    crab._last_sig = sig
+    crab._last_rect = (ix, iy, rect_w, len(lines) + 2)
 
 
 # ---------------------------------------------------------------------------
@@ -469,9 +1073,14 @@ def _main(stdscr) -> None:
     _init_colors()
 
     scanner = ProcessScanner()
+    scanner.start()
     crabs: dict[int, CrabEntity] = {}
+    pool = CrabPool() if np is not None else None
     next_color = 0
-    last_scan = 0.0
+    last_gen = 0
+    prev_hw = (-1, -1)
+    waiting = _WaitingScreen()
+    cur_timeout = int(FRAME_INTERVAL * 1000)
 
     while True:
         try:
@@ -482,12 +1091,13 @@ def _main(stdscr) -> None:
         if ch in (ord("q"), ord("Q"), 27):
             break
 
-        now = time.monotonic()
         h, w = stdscr.getmaxyx()
+        membership_changed = False
 
-        if now - last_scan >= SCAN_INTERVAL:
-            last_scan = now
-            results = scanner.scan()
+        gen = scanner.generation
+        if gen != last_gen:
+            last_gen = gen
+            results = scanner.latest
             current: set[int] = set()
 
             for info in results:
@@ -496,6 +1106,8 @@ def _main(stdscr) -> None:
 
                 if info.pid in crabs:
                     crabs[info.pid].set_active(is_active, info.cpu_pct, info.cwd, info.branch)
+                    if pool is not None:
+                        pool.sync(crabs[info.pid])
                 else:
                     color = COLOR_NAMES[next_color % len(COLOR_NAMES)]
                     next_color += 1
@@ -508,32 +1120,59 @@ def _main(stdscr) -> None:
                     )
                     crab.set_active(is_active, info.cpu_pct, info.cwd, info.branch)
                     crabs[info.pid] = crab
+                    if pool is not None:
+                        pool.add(crab)
+                    membership_changed = True
 
             for pid in list(crabs):
                 if pid not in current:
                     del crabs[pid]
+                    if pool is not None:
+                        pool.remove(pid)
+                    membership_changed = True
 
         active_count = 0
         idle_count = 0
+        if pool is not None:
+            pool.step(w, h)
+            pool.writeback(crabs)
         for crab in crabs.values():
-            crab.update()
+            crab.update(move=pool is None)
             crab.update_bounds(w, h)
             if crab.active:
                 active_count += 1
             else:
                 idle_count += 1
 
-        stdscr.erase()
+        # Nothing moves while every crab sleeps, so back off the wakeup
+        # rate; scans still fire on SCAN_INTERVAL regardless of frame rate.
+        target_timeout = int(
+            (FRAME_INTERVAL if active_count else IDLE_FRAME_INTERVAL) * 1000,
+        )
+        if target_timeout != cur_timeout:
+            cur_timeout = target_timeout
+            stdscr.timeout(target_timeout)
+
+        # Full wipe only on resize or when crabs appeared/vanished; steady
+        # state just blanks and redraws the rectangles that moved.
+        if (h, w) != prev_hw or membership_changed:
+            prev_hw = (h, w)
+            stdscr.erase()
+            for crab in crabs.values():
+                crab.mark_dirty()
+            waiting.invalidate()
         _draw_header(stdscr, len(crabs), active_count, idle_count)
 
         if not crabs:
-            _draw_waiting(stdscr)
+            waiting.draw(stdscr, h, w)
         else:
             for crab in crabs.values():
-                _draw_crab(stdscr, crab)
+                _draw_crab(stdscr, crab, h, w)
 
         stdscr.refresh()
 
+    scanner.stop()
+
 
 if __name__ == "__main__":
     curses.wrapper(_main)